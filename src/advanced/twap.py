@@ -2,7 +2,7 @@
 TWAP strategy module for Binance Futures Testnet (USDT-M).
 
 Functions:
-- run_twap(client, symbol, side, total_quantity, slices, interval_sec, dry_run=False)
+- run_twap(client, symbol, side, total_quantity, slices, interval_sec, dry_run=False, exact_summary=False)
 
 Behavior:
 - Splits total_quantity into `slices` equal parts (last slice gets remainder due to quantization).
@@ -10,13 +10,16 @@ Behavior:
     - Validates and quantizes slice quantity using validate_symbol_and_params
     - If dry_run: builds and returns signed query string for inspection
     - Else: places a MARKET order and records the response
-- Sleeps `interval_sec` between slices (not after last slice)
-- Returns a summary dict with per-slice results.
+- Paces live slices on a fixed schedule (slice i+1 starts at start + i*interval_sec),
+  so request latency does not stretch the cadence; no wait after the last slice.
+  Dry-run slices are signed back-to-back since nothing is sent to the exchange.
+- Returns a summary dict with per-slice results. Fill totals are accumulated as
+  floats unless exact_summary=True, which uses Decimal (e.g. for reconciliation).
 """
 import time
 import logging
 from decimal import Decimal, getcontext
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterator, List, Tuple
 import sys
 import os
 
@@ -29,28 +32,30 @@ getcontext().prec = 28
 logger = logging.getLogger("BasicBot")
 
 
-def _split_quantity(total_qty: float, slices: int) -> List[Decimal]:
+def _iter_slice_quantities(total_qty: float, slices: int) -> Iterator[Tuple[int, float]]:
     """
-    Split total_qty into `slices` Decimal parts. The sum of parts <= total_qty,
-    with the remainder (due to quantization) placed into the last slice.
-    This function returns Decimal parts; further quantization by exchange filters
-    will be applied during validation.
+    Yield (index, qty) for `slices` parts of total_qty on an 8-decimal grid using
+    integer math. Every slice gets the floored even share and the remainder is
+    placed into the last slice, so the parts sum to total_qty. Exchange-filter
+    quantization is applied later during validation.
     """
-    total = Decimal(str(total_qty))
     if slices <= 0:
         raise ValueError("slices must be >= 1")
-    base = (total / Decimal(slices)).quantize(Decimal("1.00000000")) 
-    parts = [base for _ in range(slices)]
-    summed = sum(parts)
-    remainder = total - summed
-    if remainder != 0:
-        parts[-1] = (parts[-1] + remainder)
-    return parts
+    scale = 10 ** 8
+    total = int(round(total_qty * scale))
+    base = total // slices
+    remainder = total - base * slices
+    for i in range(slices):
+        yield i, (base + remainder if i == slices - 1 else base) / scale
+
+
+def _to_decimal(value: Any) -> Decimal:
+    return Decimal(str(value))
 
 
 def run_twap(client: BinanceFuturesClient, symbol: str, side: str,
              total_quantity: float, slices: int = 5, interval_sec: int = 10,
-             dry_run: bool = False) -> Dict[str, Any]:
+             dry_run: bool = False, exact_summary: bool = False) -> Dict[str, Any]:
     """
     Execute a TWAP: splits total_quantity into slices and places MARKET orders.
 
@@ -75,39 +80,43 @@ def run_twap(client: BinanceFuturesClient, symbol: str, side: str,
     logger.info("Starting TWAP: symbol=%s side=%s total_qty=%s slices=%d interval=%ds dry_run=%s",
                 symbol, side, total_quantity, slices, interval_sec, dry_run)
 
-    slice_parts = _split_quantity(total_quantity, slices)
+    try:
+        exchange_info = client.get_exchange_info()
+    except Exception as e:
+        logger.error("TWAP could not prefetch exchangeInfo, slices will retry it: %s", e)
+        exchange_info = None
+
     results: List[Dict[str, Any]] = []
-    total_executed = Decimal("0")
-    total_quote = Decimal("0")
+    to_num = _to_decimal if exact_summary else float
+    total_executed = to_num(0)
+    total_quote = to_num(0)
+    base_params = {
+        "symbol": symbol,
+        "side": side,
+        "type": "MARKET",
+        "recvWindow": client.recv_window
+    }
 
-    for i, part in enumerate(slice_parts):
-        requested = float(part)
-        ts = int(time.time() * 1000)
+    start = time.monotonic()
+    for i, requested in _iter_slice_quantities(total_quantity, slices):
+        ts = client._timestamp()
         logger.info("TWAP slice %d/%d requested_qty=%s", i + 1, slices, requested)
 
-        v = validate_symbol_and_params(client, symbol, requested, price=None)
+        v = validate_symbol_and_params(client, symbol, requested, price=None, exchange_info=exchange_info)
         if not v.get("ok"):
             logger.error("TWAP slice %d validation failed: %s", i + 1, v.get("msg"))
             results.append({"slice": i + 1, "requested_qty": requested, "ok": False, "error": v.get("msg")})
-            if i != slices - 1:
-                time.sleep(interval_sec)
+            if not dry_run and i != slices - 1:
+                time.sleep(max(0.0, start + (i + 1) * interval_sec - time.monotonic()))
             continue
 
         adj_qty = v.get("adj_quantity", requested)
-        params = {
-            "symbol": symbol,
-            "side": side,
-            "type": "MARKET",
-            "quantity": adj_qty,
-            "timestamp": client._timestamp(),
-            "recvWindow": client.recv_window
-        }
+        params = {**base_params, "quantity": adj_qty}
 
         if dry_run:
-            qs = "&".join(f"{k}={params[k]}" for k in sorted(params))
+            params["timestamp"] = ts
             try:
-                sig = client._sign(qs)
-                signed = qs + "&signature=" + sig
+                signed = client.build_signed_query(params)
                 logger.info("TWAP slice %d dry-run signed query: %s", i + 1, signed)
                 results.append({"slice": i + 1, "requested_qty": requested, "adj_quantity": adj_qty,
                                 "dry_run": True, "signed_query": signed, "timestamp": ts})
@@ -116,14 +125,12 @@ def run_twap(client: BinanceFuturesClient, symbol: str, side: str,
                 results.append({"slice": i + 1, "requested_qty": requested, "error": str(e), "timestamp": ts})
         else:
             try:
-                resp = client._request_with_backoff("POST", "/fapi/v1/order", {
-                    "symbol": params["symbol"], "side": params["side"], "type": params["type"], "quantity": params["quantity"]
-                }, signed=True)
+                resp = client._request_with_backoff("POST", "/fapi/v1/order", params, signed=True)
                 logger.info("TWAP slice %d response: %s", i + 1, resp)
                 results.append({"slice": i + 1, "requested_qty": requested, "adj_quantity": adj_qty,
                                 "resp": resp, "timestamp": ts})
-                executed_qty = Decimal(str(resp.get("executedQty", "0"))) if isinstance(resp.get("executedQty", "0"), (str, float, int)) else Decimal("0")
-                avg_price = Decimal(str(resp.get("avgPrice", "0"))) if resp.get("avgPrice") else Decimal("0")
+                executed_qty = to_num(resp.get("executedQty") or 0)
+                avg_price = to_num(resp.get("avgPrice") or 0)
                 if executed_qty > 0 and avg_price > 0:
                     total_executed += executed_qty
                     total_quote += (executed_qty * avg_price)
@@ -131,11 +138,12 @@ def run_twap(client: BinanceFuturesClient, symbol: str, side: str,
                 logger.exception("TWAP slice %d failed: %s", i + 1, e)
                 results.append({"slice": i + 1, "requested_qty": requested, "error": str(e), "timestamp": ts})
 
-        if i != slices - 1:
-            logger.info("TWAP sleeping for %ds before next slice", interval_sec)
-            time.sleep(interval_sec)
+        if not dry_run and i != slices - 1:
+            delay = max(0.0, start + (i + 1) * interval_sec - time.monotonic())
+            logger.info("TWAP sleeping for %.1fs before next slice", delay)
+            time.sleep(delay)
 
-    avg_price = (total_quote / total_executed) if (total_executed > 0) else Decimal("0")
+    avg_price = (total_quote / total_executed) if (total_executed > 0) else to_num(0)
 
     summary = {
         "total_executed": float(total_executed),
@@ -1,19 +1,27 @@
 """
 Binance Futures API client (Testnet-ready)
 - Signed requests with HMAC-SHA256
-- Exponential backoff for 429/5xx
-- get_exchange_info() helper
+- Jittered exponential backoff for 429/5xx, honoring Retry-After up to BACKOFF_MAX
+- Pauses before the 1m request-weight limit is reached
+- get_exchange_info() helper (cached per base_url for EXCHANGE_INFO_TTL seconds)
 """
 import os
 import time
-import json
 import hmac
+import random
+import queue
+import atexit
 import hashlib
+import threading
 import logging
-from typing import Dict, Any, Optional
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Any, Optional, Tuple
 from pathlib import Path
+from urllib.parse import urlencode
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
 load_dotenv()
 api_key = os.getenv("BINANCE_API_KEY")
@@ -22,6 +30,14 @@ api_secret = os.getenv("BINANCE_API_SECRET")
 
 TESTNET_BASE_URL = "https://testnet.binancefuture.com"
 FAPI_EXCHANGE_INFO = "/fapi/v1/exchangeInfo"
+FAPI_PING = "/fapi/v1/ping"
+EXCHANGE_INFO_TTL = 300
+
+BACKOFF_BASE = 0.5
+BACKOFF_MAX = 30.0
+BACKOFF_JITTER = 0.5
+WEIGHT_LIMIT_1M = 2400
+WEIGHT_PAUSE_RATIO = 0.9
 
 PROJECT_ROOT = Path(__file__).parent.parent
 BOT_LOG_PATH = PROJECT_ROOT / "bot.log"
@@ -45,13 +61,39 @@ if not api_logger.handlers:
     api_fh = logging.FileHandler(API_LOG_PATH)
     api_fh.setLevel(logging.DEBUG) 
     api_fh.setFormatter(logging.Formatter("%(message)s"))
-    api_logger.addHandler(api_fh)
+    # The file write happens on the listener thread, off the HTTP request path.
+    api_queue = queue.SimpleQueue()
+    api_listener = QueueListener(api_queue, api_fh, respect_handler_level=True)
+    api_logger.addHandler(QueueHandler(api_queue))
+    api_listener.start()
+    atexit.register(api_listener.stop)
+
+
+# One pooled, keep-alive session shared by every client in the process so that
+# repeated orders (e.g. TWAP slices) reuse open TLS connections.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=0))
+_SESSION.headers.update({"Connection": "keep-alive"})
+
+_METHODS = {"GET": requests.Session.get, "POST": requests.Session.post, "DELETE": requests.Session.delete}
+
+# base_url -> (exchangeInfo payload, monotonic expiry time)
+_EXCHANGE_INFO_CACHE: Dict[str, Tuple[Dict[str, Any], float]] = {}
 
 
 class BinanceAPIError(Exception):
     pass
 
 
+def _json(resp: requests.Response) -> Any:
+    return orjson.loads(resp.content)
+
+
+def _signed_qs(params: Dict[str, Any]) -> str:
+    """Canonical (key-sorted, url-encoded) query string that gets signed."""
+    return urlencode(sorted(params.items()))
+
+
 class BinanceFuturesClient:
     def __init__(self, api_key: Optional[str] = None, api_secret: Optional[str] = None,
                  base_url: str = TESTNET_BASE_URL, recv_window: int = 5000):
@@ -59,77 +101,137 @@ class BinanceFuturesClient:
         self.api_secret = (api_secret or os.environ.get("BINANCE_API_SECRET") or "").encode()
         self.base_url = base_url.rstrip("/")
         self.recv_window = recv_window
-        self.session = requests.Session()
-        if self.api_key:
-            self.session.headers.update({"X-MBX-APIKEY": self.api_key})
+        self.session = _SESSION
+        self._headers = {"X-MBX-APIKEY": self.api_key} if self.api_key else {}
+        # Keyed once here; _sign copies it so each request skips the HMAC key setup.
+        self._hmac_template = hmac.new(self.api_secret, b"", hashlib.sha256)
+        self._used_weight = 0
+        self._weight_minute = 0
         logger.debug("BinanceFuturesClient initialized (base_url=%s)", self.base_url)
 
+    def prewarm(self) -> None:
+        """Ping the API on a background thread so the pooled connection is open before the first order."""
+        def _ping():
+            try:
+                self.session.get(self.base_url + FAPI_PING, timeout=5)
+            except requests.RequestException as e:
+                logger.debug("Connection prewarm failed: %s", e)
+        threading.Thread(target=_ping, daemon=True).start()
+
     def _timestamp(self) -> int:
-        return int(time.time() * 1000)
+        return time.time_ns() // 1_000_000
 
     def _sign(self, query_string: str) -> str:
         if not self.api_secret:
             raise ValueError("API secret required for signing")
-        return hmac.new(self.api_secret, query_string.encode("utf-8"), hashlib.sha256).hexdigest()
+        h = self._hmac_template.copy()
+        h.update(query_string.encode("utf-8"))
+        return h.hexdigest()
+
+    def build_signed_query(self, params: Dict[str, Any]) -> str:
+        """Sign params (adding timestamp/recvWindow if missing) and return the full query string."""
+        params = {"timestamp": self._timestamp(), "recvWindow": self.recv_window, **params}
+        query_string = _signed_qs(params)
+        return query_string + "&signature=" + self._sign(query_string)
+
+    def _backoff_delay(self, attempt: int, resp: Optional[requests.Response] = None) -> float:
+        delay = min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt) + random.uniform(0, BACKOFF_JITTER)
+        retry_after = resp.headers.get("Retry-After") if resp is not None else None
+        if retry_after:
+            try:
+                requested = float(retry_after)
+            except ValueError:
+                return delay
+            # Long waits (e.g. a 418 IP ban) would resend the order hours later; fail instead.
+            if requested > BACKOFF_MAX:
+                raise BinanceAPIError(f"HTTP {resp.status_code}: server asked to retry after {requested:.0f}s "
+                                      f"(cap {BACKOFF_MAX:.0f}s), giving up")
+            delay = requested
+        return delay
+
+    def _track_used_weight(self, resp: requests.Response) -> None:
+        used = resp.headers.get("X-MBX-USED-WEIGHT-1M")
+        if used and used.isdigit():
+            self._used_weight = int(used)
+            self._weight_minute = int(time.time() // 60)
+
+    def _wait_for_weight(self) -> None:
+        """Sleep until the next minute window if the last response reported >90% weight used."""
+        if self._used_weight <= WEIGHT_LIMIT_1M * WEIGHT_PAUSE_RATIO:
+            return
+        if int(time.time() // 60) == self._weight_minute:
+            pause = (self._weight_minute + 1) * 60 - time.time()
+            logger.warning("Used weight %d/%d, pausing %.1fs for the next window",
+                           self._used_weight, WEIGHT_LIMIT_1M, pause)
+            time.sleep(max(0.0, pause))
+        self._used_weight = 0
 
     def _request_with_backoff(self, method: str, path: str, params: Dict[str, Any], signed: bool = False,
                               max_retries: int = 5) -> Dict[str, Any]:
+        send = _METHODS.get(method.upper())
+        if send is None:
+            raise ValueError("Unsupported method")
         url = self.base_url + path
         params = params.copy() if params else {}
-        if signed:
-            params.setdefault("timestamp", self._timestamp())
-            params.setdefault("recvWindow", self.recv_window)
-            query_string = "&".join(f"{k}={params[k]}" for k in sorted(params))
-            signature = self._sign(query_string)
-            query_string = query_string + f"&signature={signature}"
-            full_url = url + "?" + query_string
-        else:
-            query_string = "&".join(f"{k}={params[k]}" for k in params) if params else ""
+        if not signed:
+            query_string = urlencode(params) if params else ""
             full_url = url + ("?" + query_string if query_string else "")
 
         attempt = 0
-        backoff = 0.5
+        signed_at = None
         while attempt <= max_retries:
-            api_logger.debug(json.dumps({
-                "attempt": attempt,
-                "url": full_url,
-                "method": method
-            }))
+            self._wait_for_weight()
+            # Sign once and reuse across retries, re-signing only when the timestamp
+            # has used up half of recvWindow and risks being rejected as stale.
+            if signed and (signed_at is None or (time.monotonic() - signed_at) * 1000 > self.recv_window / 2):
+                if signed_at is not None:
+                    params["timestamp"] = self._timestamp()
+                full_url = url + "?" + self.build_signed_query(params)
+                signed_at = time.monotonic()
+            if api_logger.isEnabledFor(logging.DEBUG):
+                api_logger.debug("%s", orjson.dumps({
+                    "attempt": attempt,
+                    "url": full_url,
+                    "method": method
+                }).decode())
             try:
-                if method.upper() == "GET":
-                    resp = self.session.get(full_url, timeout=10)
-                elif method.upper() == "POST":
-                    resp = self.session.post(full_url, timeout=10)
-                elif method.upper() == "DELETE":
-                    resp = self.session.delete(full_url, timeout=10)
-                else:
-                    raise ValueError("Unsupported method")
-
-                api_logger.debug(json.dumps({
-                    "status_code": resp.status_code,
-                    "response": resp.text
-                }))
+                resp = send(self.session, full_url, headers=self._headers, timeout=10)
+
+                if api_logger.isEnabledFor(logging.DEBUG):
+                    api_logger.debug("%s", orjson.dumps({
+                        "status_code": resp.status_code,
+                        "response": resp.text
+                    }).decode())
 
+                self._track_used_weight(resp)
                 if resp.status_code == 200:
-                    return resp.json()
+                    return _json(resp)
                 if resp.status_code in (429, 418) or 500 <= resp.status_code < 600:
-                    logger.warning("API returned %s. Backing off %.1fs (attempt %d)", resp.status_code, backoff, attempt)
-                    time.sleep(backoff)
+                    delay = self._backoff_delay(attempt, resp)
+                    logger.warning("API returned %s. Backing off %.1fs (attempt %d)", resp.status_code, delay, attempt)
+                    time.sleep(delay)
                     attempt += 1
-                    backoff *= 2
                     continue
                 raise BinanceAPIError(f"HTTP {resp.status_code}: {resp.text}")
             except requests.RequestException as e:
                 logger.exception("Network error on request: %s", e)
-                time.sleep(backoff)
+                time.sleep(self._backoff_delay(attempt))
                 attempt += 1
-                backoff *= 2
 
         raise BinanceAPIError("Max retries exceeded")
 
     def get_exchange_info(self) -> Dict[str, Any]:
+        """
+        Full exchangeInfo for every symbol. Unlike spot's /api/v3/exchangeInfo, the
+        USDT-M endpoint takes no ?symbol= filter, so callers share one cached payload.
+        """
+        cached = _EXCHANGE_INFO_CACHE.get(self.base_url)
+        if cached and cached[1] > time.monotonic():
+            return cached[0]
         logger.debug("Fetching exchangeInfo")
-        return self._request_with_backoff("GET", FAPI_EXCHANGE_INFO, params={}, signed=False)
+        info = self._request_with_backoff("GET", FAPI_EXCHANGE_INFO, params={}, signed=False)
+        _EXCHANGE_INFO_CACHE[self.base_url] = (info, time.monotonic() + EXCHANGE_INFO_TTL)
+        return info
 
 
 if __name__ == "__main__":
@@ -110,6 +110,7 @@ def main():
     args = parser.parse_args()
 
     client = BinanceFuturesClient()
+    client.prewarm()
 
     if args.type == "TWAP":
         run_twap_order(client, args)
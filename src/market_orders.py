@@ -32,11 +32,7 @@ def place_market_order(client: BinanceFuturesClient, symbol: str, side: str, qua
 
     if dry_run:
         try:
-            params.setdefault("timestamp", client._timestamp())
-            params.setdefault("recvWindow", client.recv_window)
-            qs = "&".join(f"{k}={params[k]}" for k in sorted(params))
-            sig = client._sign(qs)
-            return {"dry_run": True, "signed_query": qs + "&signature=" + sig}
+            return {"dry_run": True, "signed_query": client.build_signed_query(params)}
         except Exception as e:
             logger.exception("Dry-run signing failed: %s", e)
             return {"error": str(e)}
@@ -2,8 +2,10 @@
 Validation helpers for Binance Futures symbols and filters.
 """
 from decimal import Decimal, ROUND_DOWN, getcontext
-from typing import Optional, Dict, Any
+from functools import lru_cache
+from typing import Optional, Dict, Any, Tuple
 import logging
+import math
 
 getcontext().prec = 28
 
@@ -11,91 +13,117 @@ from api_client import BinanceFuturesClient
 
 logger = logging.getLogger("BasicBot")
 
+# Index of the last exchangeInfo payload seen. The client's TTL cache returns the
+# same dict until it expires, so the index is rebuilt at most once per fetch.
+_INDEX_CACHE: Dict[str, Any] = {"info": None, "index": {}}
+
+def _build_index(exchange_info: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    return {
+        s["symbol"]: {"info": s, "filters": {f["filterType"]: f for f in s.get("filters", [])}}
+        for s in exchange_info.get("symbols", [])
+    }
+
+def _get_index(exchange_info: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    if _INDEX_CACHE["info"] is not exchange_info:
+        _INDEX_CACHE["index"] = _build_index(exchange_info)
+        _INDEX_CACHE["info"] = exchange_info
+    return _INDEX_CACHE["index"]
+
 def parse_symbol_info(exchange_info: Dict[str, Any], symbol: str) -> Optional[Dict[str, Any]]:
-    for s in exchange_info.get("symbols", []):
-        if s.get("symbol") == symbol:
-            return s
-    return None
+    entry = _get_index(exchange_info).get(symbol)
+    return entry["info"] if entry else None
 
-def _get_filter_value(symbol_info: Dict[str, Any], filter_type: str, key: str):
-    for f in symbol_info.get("filters", []):
-        if f.get("filterType") == filter_type:
-            return f.get(key)
-    return None
+@lru_cache(maxsize=None)
+def _decimals_and_int(step_size: str) -> Tuple[int, int]:
+    """Return (step_int, scale) such that step_size == step_int / scale, e.g. "0.010" -> (1, 100)."""
+    whole, _, frac = step_size.strip().partition(".")
+    frac = frac.rstrip("0")
+    return int(whole + frac), 10 ** len(frac)
 
+def _floor_to_step(value: float, step_size: str) -> float:
+    """Round value down to a multiple of step_size using integer arithmetic."""
+    step_int, scale = _decimals_and_int(step_size)
+    scaled = value * scale
+    units = round(scaled)
+    # Treat float noise such as 0.003 * 1000 == 2.9999999999999996 as an exact multiple.
+    if abs(scaled - units) > 1e-15 * max(1.0, abs(scaled)):
+        units = math.floor(scaled)
+    return (units // step_int) * step_int / scale
+
+# Public Decimal helpers for callers outside this module; validation itself uses
+# the float-returning _floor_to_step on the hot path.
 def quantize_qty(qty: float, step_size: str) -> Decimal:
-    step = Decimal(step_size)
-    qty_d = Decimal(str(qty))
-    return (qty_d // step * step).quantize(step)
+    return Decimal(str(_floor_to_step(qty, step_size))).quantize(Decimal(step_size))
 
 def quantize_price(price: float, tick_size: str) -> Decimal:
-    tick = Decimal(tick_size)
-    p = Decimal(str(price))
-    return (p // tick * tick).quantize(tick)
+    return Decimal(str(_floor_to_step(price, tick_size))).quantize(Decimal(tick_size))
 
 def validate_symbol_and_params(client: BinanceFuturesClient, symbol: str,
                                quantity: float, price: Optional[float] = None,
-                               stop_price: Optional[float] = None) -> Dict[str, Any]:
+                               stop_price: Optional[float] = None,
+                               exchange_info: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     result = {"ok": False, "msg": "", "symbol": symbol}
-    try:
-        info = client.get_exchange_info()
-    except Exception as e:
-        result["msg"] = f"Failed to fetch exchangeInfo: {e}"
-        return result
+    info = exchange_info
+    if info is None:
+        try:
+            info = client.get_exchange_info()
+        except Exception as e:
+            result["msg"] = f"Failed to fetch exchangeInfo: {e}"
+            return result
 
-    sym_info = parse_symbol_info(info, symbol)
-    if not sym_info:
+    entry = _get_index(info).get(symbol)
+    if not entry:
         result["msg"] = f"Symbol {symbol} not found in exchangeInfo"
         return result
+    sym_info = entry["info"]
 
-    min_qty = _get_filter_value(sym_info, "LOT_SIZE", "minQty")
-    step_size = _get_filter_value(sym_info, "LOT_SIZE", "stepSize")
-    max_qty = _get_filter_value(sym_info, "LOT_SIZE", "maxQty")
+    lot_size = entry["filters"].get("LOT_SIZE", {})
+    min_qty = lot_size.get("minQty")
+    step_size = lot_size.get("stepSize")
+    max_qty = lot_size.get("maxQty")
 
-    tick_size = _get_filter_value(sym_info, "PRICE_FILTER", "tickSize")
-    min_price = _get_filter_value(sym_info, "PRICE_FILTER", "minPrice")
-    max_price = _get_filter_value(sym_info, "PRICE_FILTER", "maxPrice")
+    price_filter = entry["filters"].get("PRICE_FILTER", {})
+    tick_size = price_filter.get("tickSize")
+    min_price = price_filter.get("minPrice")
+    max_price = price_filter.get("maxPrice")
 
-    qty_dec = Decimal(str(quantity))
-    if min_qty and qty_dec < Decimal(str(min_qty)):
+    if min_qty and quantity < float(min_qty):
         result["msg"] = f"Quantity {quantity} below minQty {min_qty}"
         return result
-    if max_qty and qty_dec > Decimal(str(max_qty)):
+    if max_qty and quantity > float(max_qty):
         result["msg"] = f"Quantity {quantity} above maxQty {max_qty}"
         return result
     
-    adj_qty = quantize_qty(quantity, step_size) if step_size else qty_dec
+    adj_qty = _floor_to_step(quantity, step_size) if step_size else float(quantity)
     if adj_qty == 0:
         result["msg"] = f"Quantity {quantity} quantized to 0 with stepSize {step_size}"
         return result
 
     adj_price = None
     if price is not None:
-        price_dec = Decimal(str(price))
-        if min_price and price_dec < Decimal(str(min_price)):
+        if min_price and price < float(min_price):
             result["msg"] = f"Price {price} below minPrice {min_price}"
             return result
-        if max_price and price_dec > Decimal(str(max_price)):
+        if max_price and price > float(max_price):
             result["msg"] = f"Price {price} above maxPrice {max_price}"
             return result
-        adj_price = quantize_price(price, tick_size) if tick_size else price_dec
+        adj_price = _floor_to_step(price, tick_size) if tick_size else float(price)
 
     adj_stop_price = None
     if stop_price is not None:
-        stop_price_dec = Decimal(str(stop_price))
-        if min_price and stop_price_dec < Decimal(str(min_price)):
+        if min_price and stop_price < float(min_price):
             result["msg"] = f"Stop price {stop_price} below minPrice {min_price}"
             return result
-        if max_price and stop_price_dec > Decimal(str(max_price)):
+        if max_price and stop_price > float(max_price):
             result["msg"] = f"Stop price {stop_price} above maxPrice {max_price}"
             return result
-        adj_stop_price = quantize_price(stop_price, tick_size) if tick_size else stop_price_dec
+        adj_stop_price = _floor_to_step(stop_price, tick_size) if tick_size else float(stop_price)
 
     result.update({
         "ok": True, "msg": "validated",
-        "adj_quantity": float(adj_qty),
-        "adj_price": float(adj_price) if adj_price is not None else None,
-        "adj_stop_price": float(adj_stop_price) if adj_stop_price is not None else None,
+        "adj_quantity": adj_qty,
+        "adj_price": adj_price,
+        "adj_stop_price": adj_stop_price,
         "symbol_info": {"baseAsset": sym_info.get("baseAsset"), "quoteAsset": sym_info.get("quoteAsset")}
     })
     return result
@@ -0,0 +1,57 @@
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+
+import api_client
+from api_client import BinanceFuturesClient, BinanceAPIError
+
+
+class _StubResponse:
+    def __init__(self, status_code, headers):
+        self.status_code = status_code
+        self.headers = headers
+        self.text = ""
+        self.content = b""
+
+
+class _StubSession:
+    """Stands in for requests.Session; Session.get/post delegate to .request()."""
+    def __init__(self, response):
+        self.response = response
+        self.calls = 0
+
+    def request(self, method, url, **kwargs):
+        self.calls += 1
+        return self.response
+
+
+def test_long_retry_after_raises_without_sleeping():
+    """
+    A 418 ban with Retry-After beyond BACKOFF_MAX must fail fast, not sleep and resend the order.
+    """
+    client = BinanceFuturesClient(api_key="test_key", api_secret="test_secret_not_a_real_key")
+    client.session = _StubSession(_StubResponse(418, {"Retry-After": "7200"}))
+
+    sleeps = []
+    real_sleep = api_client.time.sleep
+    api_client.time.sleep = sleeps.append
+    try:
+        try:
+            client._request_with_backoff("POST", "/fapi/v1/order",
+                                         {"symbol": "BTCUSDT", "side": "BUY", "type": "MARKET", "quantity": 0.001},
+                                         signed=True)
+        except BinanceAPIError as e:
+            assert "7200" in str(e)
+        else:
+            raise AssertionError("expected BinanceAPIError for a Retry-After above BACKOFF_MAX")
+    finally:
+        api_client.time.sleep = real_sleep
+
+    assert sleeps == []
+    assert client.session.calls == 1
+
+
+if __name__ == "__main__":
+    test_long_retry_after_raises_without_sleeping()
+    print("Backoff test passed.")
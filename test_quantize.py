@@ -0,0 +1,47 @@
+import os
+import sys
+from decimal import Decimal
+
+sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+
+from validation import _decimals_and_int, _floor_to_step, quantize_qty, quantize_price
+
+
+def test_step_parsing():
+    assert _decimals_and_int("0.001") == (1, 1000)
+    assert _decimals_and_int("0.010") == (1, 100)
+    assert _decimals_and_int("1.000") == (1, 1)
+    assert _decimals_and_int("0.50") == (5, 10)
+    assert _decimals_and_int("1") == (1, 1)
+    assert _decimals_and_int("10") == (10, 1)
+
+
+def test_float_noise_snaps_to_exact_multiple():
+    # 0.003 * 1000 == 2.9999999999999996 in binary floating point.
+    assert _floor_to_step(0.003, "0.001") == 0.003
+    assert _floor_to_step(0.1 + 0.2, "0.1") == 0.3
+
+
+def test_just_below_boundary_is_floored():
+    assert _floor_to_step(0.0029999, "0.001") == 0.002
+    assert _floor_to_step(2.999999, "1") == 2.0
+    assert _floor_to_step(3000.129, "0.01") == 3000.12
+    assert _floor_to_step(25, "10") == 20.0
+
+
+def test_decimal_wrappers_are_step_formatted():
+    qty = quantize_qty(0.0123, "0.001")
+    assert isinstance(qty, Decimal)
+    assert str(qty) == "0.012"
+    assert str(quantize_qty(0.5, "0.00100000")) == "0.50000000"
+    price = quantize_price(3000.129, "0.10")
+    assert isinstance(price, Decimal)
+    assert str(price) == "3000.10"
+
+
+if __name__ == "__main__":
+    test_step_parsing()
+    test_float_noise_snaps_to_exact_multiple()
+    test_just_below_boundary_is_floored()
+    test_decimal_wrappers_are_step_formatted()
+    print("Quantize tests passed.")
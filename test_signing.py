@@ -0,0 +1,32 @@
+import os
+import sys
+import hmac
+import hashlib
+
+sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+
+from api_client import BinanceFuturesClient
+
+
+def test_sign_matches_hmac_new():
+    """
+    _sign() reuses a pre-keyed HMAC object; its output must match a freshly keyed one.
+    """
+    secret = "test_secret_not_a_real_key"
+    client = BinanceFuturesClient(api_key="test_key", api_secret=secret)
+
+    query_strings = [
+        "",
+        "recvWindow=5000&side=BUY&symbol=BTCUSDT&timestamp=1700000000000&type=MARKET&quantity=0.001",
+        "price=3000.0&quantity=0.1&recvWindow=5000&side=SELL&symbol=ETHUSDT&timeInForce=GTC&timestamp=1700000000001&type=LIMIT",
+    ]
+    for qs in query_strings:
+        expected = hmac.new(secret.encode(), qs.encode("utf-8"), hashlib.sha256).hexdigest()
+        assert client._sign(qs) == expected
+        # Signing twice must not leak state between requests.
+        assert client._sign(qs) == expected
+
+
+if __name__ == "__main__":
+    test_sign_matches_hmac_new()
+    print("Signing test passed.")
@@ -0,0 +1,35 @@
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+
+from advanced.twap import _iter_slice_quantities
+
+SCALE = 10 ** 8
+
+
+def _parts(total_qty, slices):
+    return [qty for _, qty in _iter_slice_quantities(total_qty, slices)]
+
+
+def test_remainder_goes_to_last_slice():
+    assert _parts(1.0, 3) == [0.33333333, 0.33333333, 0.33333334]
+    assert [i for i, _ in _iter_slice_quantities(1.0, 3)] == [0, 1, 2]
+
+
+def test_parts_sum_exactly_on_the_grid():
+    for total_qty, slices in [(1.0, 3), (0.5, 7), (0.123, 10), (12.34567891, 9), (0.001, 1)]:
+        units = [round(qty * SCALE) for qty in _parts(total_qty, slices)]
+        assert len(units) == slices
+        assert sum(units) == round(total_qty * SCALE)
+
+
+def test_more_slices_than_units_gives_zero_slices():
+    assert _parts(0.00000002, 5) == [0.0, 0.0, 0.0, 0.0, 0.00000002]
+
+
+if __name__ == "__main__":
+    test_remainder_goes_to_last_slice()
+    test_parts_sum_exactly_on_the_grid()
+    test_more_slices_than_units_gives_zero_slices()
+    print("TWAP split tests passed.")